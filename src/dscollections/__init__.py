@@ -1,6 +1,7 @@
 """dscollections: Professional data structures package for Python."""
 
-from .advanced import DisjointSet, Trie
+from ._dsu_fast import DisjointSetInt
+from .advanced import AsciiTrie, DisjointSet, Trie
 from .graph import Graph
 from .heap import MaxHeap, MinHeap, PriorityQueue
 from .linear import (
@@ -31,5 +32,7 @@ __all__ = [
     "HashMap",
     "HashSet",
     "DisjointSet",
+    "DisjointSetInt",
     "Trie",
+    "AsciiTrie",
 ]
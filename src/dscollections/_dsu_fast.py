@@ -0,0 +1,129 @@
+"""Integer-keyed union-find with optional Numba acceleration."""
+
+from __future__ import annotations
+
+try:  # optional speedup: compiled kernels when numpy + numba are installed
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - exercised only without the extras
+    _np = None
+
+
+if _np is not None:
+
+    @_njit(cache=True)
+    def _find(parent, x):  # pragma: no cover - compiled
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    @_njit(cache=True)
+    def _union(parent, rank, a, b):  # pragma: no cover - compiled
+        ra = _find(parent, a)
+        rb = _find(parent, b)
+        if ra == rb:
+            return
+        if rank[ra] < rank[rb]:
+            parent[ra] = rb
+        elif rank[ra] > rank[rb]:
+            parent[rb] = ra
+        else:
+            parent[rb] = ra
+            rank[ra] += 1
+
+    @_njit(cache=True)
+    def _union_many(parent, rank, u, v):  # pragma: no cover - compiled
+        # Must stay sequential: rank/parent updates race under parallel
+        # execution and numba exposes no atomic compare-and-swap to fix that.
+        for i in range(u.shape[0]):
+            _union(parent, rank, u[i], v[i])
+
+
+class DisjointSetInt:
+    """Union-Find over the dense integer range ``[0, n)``.
+
+    Unlike :class:`~dscollections.advanced.DisjointSet` there is no key
+    mapping: elements *are* their indices. With numpy and numba installed the
+    find/union loops run as compiled kernels (``cache=True`` so the JIT cost
+    is paid once per machine, not per process); otherwise a pure-Python
+    flat-list implementation with the same API is used.
+    """
+
+    def __init__(self, n: int) -> None:
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        if _np is not None:
+            self._parent = _np.arange(n, dtype=_np.int32)
+            self._rank = _np.zeros(n, dtype=_np.uint8)
+        else:
+            self._parent = list(range(n))
+            self._rank = bytearray(n)
+
+    def _check_index(self, x: int) -> None:
+        # The compiled kernels index without bounds checks, and the Python
+        # fallback would wrap negative indices; reject both up front.
+        if not 0 <= x < len(self._parent):
+            raise IndexError(
+                f"element {x} out of range for DisjointSetInt of size {len(self._parent)}"
+            )
+
+    def find(self, x: int) -> int:
+        self._check_index(x)
+        if _np is not None:
+            return int(_find(self._parent, x))
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        self._check_index(a)
+        self._check_index(b)
+        if _np is not None:
+            _union(self._parent, self._rank, a, b)
+            return
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self._rank[ra] < self._rank[rb]:
+            self._parent[ra] = rb
+        elif self._rank[ra] > self._rank[rb]:
+            self._parent[rb] = ra
+        else:
+            self._parent[rb] = ra
+            self._rank[ra] += 1
+
+    def union_many(self, u, v) -> None:
+        """Union each pair ``(u[i], v[i])`` from two parallel sequences.
+
+        With the compiled backend the whole edge list is processed inside a
+        single kernel call, amortizing dispatch overhead over every edge.
+        """
+        if len(u) != len(v):
+            raise ValueError("u and v must have the same length")
+        if _np is not None:
+            u = _np.ascontiguousarray(u, dtype=_np.int32)
+            v = _np.ascontiguousarray(v, dtype=_np.int32)
+            n = len(self._parent)
+            for arr in (u, v):
+                if arr.size and (int(arr.min()) < 0 or int(arr.max()) >= n):
+                    raise IndexError(f"element out of range for DisjointSetInt of size {n}")
+            _union_many(self._parent, self._rank, u, v)
+            return
+        union = self.union
+        for a, b in zip(u, v):
+            union(a, b)
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __repr__(self) -> str:
+        groups: dict[int, list[int]] = {}
+        for x in range(len(self._parent)):
+            groups.setdefault(self.find(x), []).append(x)
+        return f"DisjointSetInt(n={len(self._parent)}, groups={groups!r})"
@@ -2,94 +2,263 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Generic, TypeVar
+import array
+from typing import Dict, Generic, Iterable, TypeVar
 
 T = TypeVar("T")
 
 
 class DisjointSet(Generic[T]):
-    """Union-Find / Disjoint Set Union (DSU)."""
+    """Union-Find / Disjoint Set Union (DSU).
+
+    Items are mapped to dense integer ids once on ``make_set``; the parent
+    forest lives in a flat ``list`` and ranks in a ``bytearray``, so the hot
+    ``find``/``union`` loops use integer indexing instead of hashing items.
+    """
 
     def __init__(self) -> None:
-        self._parent: Dict[T, T] = {}
-        self._rank: Dict[T, int] = {}
+        self._index: Dict[T, int] = {}
+        self._items: list[T] = []
+        self._parent: list[int] = []
+        self._rank = bytearray()
 
     def make_set(self, item: T) -> None:
-        if item not in self._parent:
-            self._parent[item] = item
-            self._rank[item] = 0
+        if item not in self._index:
+            self._index[item] = len(self._parent)
+            self._items.append(item)
+            self._parent.append(len(self._parent))
+            self._rank.append(0)
 
-    def find(self, item: T) -> T:
-        if item not in self._parent:
+    def _index_of(self, item: T) -> int:
+        idx = self._index.get(item)
+        if idx is None:
             self.make_set(item)
-        parent = self._parent[item]
-        if parent != item:
-            self._parent[item] = self.find(parent)
-        return self._parent[item]
+            idx = self._index[item]
+        return idx
+
+    def _find_root(self, idx: int) -> int:
+        # Iterative path halving: same amortized bound as full path
+        # compression, but a single pass with no recursion depth limit.
+        parent = self._parent
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def find(self, item: T) -> T:
+        return self._items[self._find_root(self._index_of(item))]
 
     def union(self, a: T, b: T) -> None:
-        ra, rb = self.find(a), self.find(b)
+        ra = self._find_root(self._index_of(a))
+        rb = self._find_root(self._index_of(b))
         if ra == rb:
             return
-        if self._rank[ra] < self._rank[rb]:
-            self._parent[ra] = rb
-        elif self._rank[ra] > self._rank[rb]:
-            self._parent[rb] = ra
-        else:
-            self._parent[rb] = ra
-            self._rank[ra] += 1
+        # Swap so ra is the higher-ranked root, then always link rb under
+        # ra; only an equal-rank link deepens the tree and bumps the rank.
+        rank = self._rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
 
     def connected(self, a: T, b: T) -> bool:
-        return self.find(a) == self.find(b)
+        return self._find_root(self._index_of(a)) == self._find_root(self._index_of(b))
 
     def __repr__(self) -> str:
         groups: Dict[T, list[T]] = {}
-        for item in self._parent:
+        for item in self._items:
             groups.setdefault(self.find(item), []).append(item)
         normalized = {root: sorted(items) for root, items in groups.items()}
         return f"DisjointSet(groups={normalized!r})"
 
 
-@dataclass
-class _TrieNode:
-    children: dict[str, _TrieNode] = field(default_factory=dict)
-    is_end: bool = False
-
-
 class Trie:
-    """Prefix tree for string keys."""
+    """Prefix tree for string keys.
+
+    Nodes are dense integer ids rather than per-node objects: node ``i`` has
+    its child table in ``self._children[i]`` (keyed by code point) and its
+    terminal flag in ``self._is_end[i]``, which keeps the structure compact
+    and the per-character walk free of attribute lookups.
+    """
 
     def __init__(self) -> None:
-        self._root = _TrieNode()
+        self._children: list[dict[int, int]] = [{}]  # node 0 is the root
+        self._is_end = bytearray([0])
         self._size = 0
+        self._backend = "python"
+
+    @staticmethod
+    def ascii() -> AsciiTrie:
+        """Return an :class:`AsciiTrie`, faster for ASCII-only keys."""
+        return AsciiTrie()
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], backend: str = "auto") -> Trie:
+        """Bulk-build a trie from ``words``.
+
+        With ``backend="auto"`` (the default) the read-only C-backed
+        ``marisa-trie`` package is used when installed, which is much faster
+        and smaller for read-mostly workloads; otherwise this falls back to
+        the mutable pure-Python trie. ``backend="marisa"`` requires the
+        package; ``backend="python"`` always builds the pure-Python trie.
+        """
+        if backend not in ("auto", "marisa", "python"):
+            raise ValueError(f"unknown backend {backend!r}; expected 'auto', 'marisa' or 'python'")
+        words = list(words)
+        if backend in ("auto", "marisa"):
+            try:
+                import marisa_trie
+            except ImportError:
+                if backend == "marisa":
+                    raise
+            else:
+                trie = cls.__new__(cls)
+                trie._impl = marisa_trie.Trie(words)
+                trie._size = len(trie._impl)
+                trie._backend = "marisa"
+                return trie
+        trie = cls()
+        trie.insert_many(words)
+        return trie
 
     def insert(self, word: str) -> None:
-        node = self._root
+        if self._backend != "python":
+            raise TypeError(f"Trie with {self._backend!r} backend is read-only")
+        children = self._children
+        node = 0
         for ch in word:
-            node = node.children.setdefault(ch, _TrieNode())
-        if not node.is_end:
-            node.is_end = True
+            key = ord(ch)
+            nxt = children[node].get(key)
+            if nxt is None:
+                nxt = len(children)
+                children.append({})
+                self._is_end.append(0)
+                children[node][key] = nxt
+            node = nxt
+        if not self._is_end[node]:
+            self._is_end[node] = 1
             self._size += 1
 
+    def insert_many(self, words: Iterable[str]) -> None:
+        """Insert many words, re-descending only past each word's new suffix.
+
+        Sorting lets consecutive words share their longest common prefix, so
+        the walk rewinds to the fork point instead of starting from the root
+        — total work approaches one visit per distinct trie edge.
+        """
+        if self._backend != "python":
+            raise TypeError(f"Trie with {self._backend!r} backend is read-only")
+        children = self._children
+        is_end = self._is_end
+        prev = ""
+        stack = [0]  # stack[i] = node reached after consuming prev[:i]
+        for word in sorted(set(words)):
+            lcp = 0
+            limit = min(len(prev), len(word))
+            while lcp < limit and prev[lcp] == word[lcp]:
+                lcp += 1
+            del stack[lcp + 1 :]
+            node = stack[-1]
+            for ch in word[lcp:]:
+                key = ord(ch)
+                nxt = children[node].get(key)
+                if nxt is None:
+                    nxt = len(children)
+                    children.append({})
+                    is_end.append(0)
+                    children[node][key] = nxt
+                node = nxt
+                stack.append(node)
+            if not is_end[node]:
+                is_end[node] = 1
+                self._size += 1
+            prev = word
+
+    def _walk(self, chars: str) -> int:
+        """Return the node id reached by ``chars``, or -1 if absent."""
+        children = self._children
+        node = 0
+        for ch in chars:
+            nxt = children[node].get(ord(ch))
+            if nxt is None:
+                return -1
+            node = nxt
+        return node
+
     def search(self, word: str) -> bool:
-        node = self._root
-        for ch in word:
-            if ch not in node.children:
-                return False
-            node = node.children[ch]
-        return node.is_end
+        if self._backend == "marisa":
+            return word in self._impl
+        node = self._walk(word)
+        return node >= 0 and bool(self._is_end[node])
 
     def starts_with(self, prefix: str) -> bool:
-        node = self._root
-        for ch in prefix:
-            if ch not in node.children:
-                return False
-            node = node.children[ch]
-        return True
+        if self._backend == "marisa":
+            return next(self._impl.iterkeys(prefix), None) is not None
+        return self._walk(prefix) >= 0
 
     def __len__(self) -> int:
         return self._size
 
     def __repr__(self) -> str:
         return f"Trie(size={self._size})"
+
+
+class AsciiTrie:
+    """Prefix tree specialized for ASCII keys.
+
+    Every node owns a fixed block of :data:`ALPHABET` child slots inside one
+    contiguous ``array('i')``, so a transition is ``children[node * 128 + c]``
+    — pure integer arithmetic on a flat buffer instead of a per-node dict
+    probe. Inserting a non-ASCII word raises :class:`UnicodeEncodeError`.
+    """
+
+    ALPHABET = 128
+
+    def __init__(self) -> None:
+        self._children = array.array("i", [-1] * self.ALPHABET)  # node 0 is the root
+        self._is_end = bytearray([0])
+        self._size = 0
+
+    def insert(self, word: str) -> None:
+        children = self._children
+        node = 0
+        for c in word.encode("ascii"):
+            offset = node * 128 + c
+            nxt = children[offset]
+            if nxt < 0:
+                nxt = len(self._is_end)
+                children.extend([-1] * 128)
+                self._is_end.append(0)
+                children[offset] = nxt
+            node = nxt
+        if not self._is_end[node]:
+            self._is_end[node] = 1
+            self._size += 1
+
+    def _walk(self, chars: str) -> int:
+        """Return the node id reached by ``chars``, or -1 if absent."""
+        try:
+            encoded = chars.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+        children = self._children
+        node = 0
+        for c in encoded:
+            node = children[node * 128 + c]
+            if node < 0:
+                return -1
+        return node
+
+    def search(self, word: str) -> bool:
+        node = self._walk(word)
+        return node >= 0 and bool(self._is_end[node])
+
+    def starts_with(self, prefix: str) -> bool:
+        return self._walk(prefix) >= 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"AsciiTrie(size={self._size})"
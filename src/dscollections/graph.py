@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import deque
 from typing import Deque, Dict, Generic, Iterator, Set, TypeVar
 
+#: Largest neighbor list that __repr__ will fully sort (see map._REPR_LIMIT).
+_REPR_LIMIT = 20
+
 T = TypeVar("T")
 
 
@@ -12,18 +16,20 @@ class Graph(Generic[T]):
     """Adjacency-list graph (directed by default)."""
 
     def __init__(self, directed: bool = True) -> None:
-        self._adjacency: Dict[T, Set[T]] = {}
+        # Neighbor "sets" are dicts with None values: same O(1) membership,
+        # but a smaller footprint per edge and insertion-ordered iteration.
+        self._adjacency: Dict[T, Dict[T, None]] = {}
         self._directed = directed
 
     def add_vertex(self, vertex: T) -> None:
-        self._adjacency.setdefault(vertex, set())
+        self._adjacency.setdefault(vertex, {})
 
     def add_edge(self, source: T, destination: T) -> None:
         self.add_vertex(source)
         self.add_vertex(destination)
-        self._adjacency[source].add(destination)
+        self._adjacency[source][destination] = None
         if not self._directed:
-            self._adjacency[destination].add(source)
+            self._adjacency[destination][source] = None
 
     def neighbors(self, vertex: T) -> Set[T]:
         if vertex not in self._adjacency:
@@ -35,15 +41,40 @@ class Graph(Generic[T]):
             raise KeyError(f"start vertex {start!r} does not exist")
         visited: Set[T] = {start}
         queue: Deque[T] = deque([start])
+        # Bind hot-loop methods to locals once; saves an attribute lookup
+        # per visited vertex and per discovered edge.
+        popleft = queue.popleft
+        append = queue.append
+        mark_visited = visited.add
+        adjacency = self._adjacency
         while queue:
-            node = queue.popleft()
+            node = popleft()
             yield node
-            for n in self._adjacency[node]:
+            for n in adjacency[node]:
                 if n not in visited:
-                    visited.add(n)
-                    queue.append(n)
+                    mark_visited(n)
+                    append(n)
 
     def dfs(self, start: T) -> Iterator[T]:
+        if start not in self._adjacency:
+            raise KeyError(f"start vertex {start!r} does not exist")
+        visited: Set[T] = set()
+        stack = [start]
+        adjacency = self._adjacency
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            yield node
+            stack.extend(adjacency[node])
+
+    def dfs_sorted(self, start: T) -> Iterator[T]:
+        """DFS visiting neighbors in sorted order, for deterministic walks.
+
+        Pays an O(deg log deg) sort per visited vertex; prefer :meth:`dfs`
+        when the visit order among siblings does not matter.
+        """
         if start not in self._adjacency:
             raise KeyError(f"start vertex {start!r} does not exist")
         visited: Set[T] = set()
@@ -60,5 +91,13 @@ class Graph(Generic[T]):
         return len(self._adjacency)
 
     def __repr__(self) -> str:
-        body = {k: sorted(v) for k, v in self._adjacency.items()}
+        body = {}
+        for vertex, neighbors in self._adjacency.items():
+            if len(neighbors) <= _REPR_LIMIT:
+                body[vertex] = sorted(neighbors)
+            else:
+                # O(deg log k) instead of a full sort of a huge neighbor list;
+                # the truncation note sits outside the list, as in HashSet.
+                shown = heapq.nsmallest(_REPR_LIMIT, neighbors)
+                body[vertex] = f"{shown!r} + {len(neighbors) - _REPR_LIMIT} more"
         return f"Graph(directed={self._directed}, adjacency={body!r})"
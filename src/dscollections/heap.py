@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import heapq
+from itertools import count
 from typing import Generic, Iterable, TypeVar
 
 T = TypeVar("T")
@@ -12,7 +13,12 @@ class MinHeap(Generic[T]):
     """Minimum heap."""
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
-        self._heap = list(values) if values is not None else []
+        if values is None:
+            self._heap: list[T] = []
+        elif type(values) is list:
+            self._heap = values.copy()  # C memcpy, faster than list(iterable)
+        else:
+            self._heap = list(values)
         heapq.heapify(self._heap)
 
     def push(self, value: T) -> None:
@@ -28,6 +34,16 @@ class MinHeap(Generic[T]):
             raise IndexError("peek from empty MinHeap")
         return self._heap[0]
 
+    def push_pop(self, value: T) -> T:
+        """Push ``value`` then pop the minimum with a single sift."""
+        return heapq.heappushpop(self._heap, value)
+
+    def replace(self, value: T) -> T:
+        """Pop the minimum then push ``value`` with a single sift."""
+        if not self._heap:
+            raise IndexError("replace on empty MinHeap")
+        return heapq.heapreplace(self._heap, value)
+
     def __len__(self) -> int:
         return len(self._heap)
 
@@ -36,50 +52,77 @@ class MinHeap(Generic[T]):
 
 
 class MaxHeap(Generic[T]):
-    """Maximum heap for numeric/comparable values."""
+    """Maximum heap for numeric values.
+
+    Values are stored negated in a flat list, so each entry is a single
+    number rather than a ``(-value, value)`` tuple; elements must support
+    unary minus (ints, floats, fractions, ...).
+    """
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
-        self._heap: list[tuple[T, T]] = []
-        if values is not None:
-            for value in values:
-                self.push(value)
+        if values is None:
+            self._heap: list[T] = []
+        else:
+            self._heap = [-value for value in values]  # type: ignore[operator]
+            heapq.heapify(self._heap)
 
     def push(self, value: T) -> None:
-        heapq.heappush(self._heap, (-value, value))  # type: ignore[operator]
+        heapq.heappush(self._heap, -value)  # type: ignore[operator]
 
     def pop(self) -> T:
         if not self._heap:
             raise IndexError("pop from empty MaxHeap")
-        return heapq.heappop(self._heap)[1]
+        return -heapq.heappop(self._heap)  # type: ignore[operator]
 
     def peek(self) -> T:
         if not self._heap:
             raise IndexError("peek from empty MaxHeap")
-        return self._heap[0][1]
+        return -self._heap[0]  # type: ignore[operator]
+
+    def push_pop(self, value: T) -> T:
+        """Push ``value`` then pop the maximum with a single sift."""
+        return -heapq.heappushpop(self._heap, -value)  # type: ignore[operator]
+
+    def replace(self, value: T) -> T:
+        """Pop the maximum then push ``value`` with a single sift."""
+        if not self._heap:
+            raise IndexError("replace on empty MaxHeap")
+        return -heapq.heapreplace(self._heap, -value)  # type: ignore[operator]
 
     def __len__(self) -> int:
         return len(self._heap)
 
     def __repr__(self) -> str:
-        return f"MaxHeap(sorted_desc={sorted((item[1] for item in self._heap), reverse=True)!r})"
+        return f"MaxHeap(sorted_desc={sorted((-item for item in self._heap), reverse=True)!r})"
 
 
 class PriorityQueue(Generic[T]):
-    """Min-priority queue where lower integer priority is dequeued first."""
+    """Min-priority queue where lower integer priority is dequeued first.
 
-    def __init__(self) -> None:
-        self._heap: list[tuple[int, int, T]] = []
-        self._seq = 0
+    ``items`` may seed the queue with ``(item, priority)`` pairs; seeding
+    heapifies once in O(n) instead of pushing each entry individually.
+    """
+
+    def __init__(self, items: Iterable[tuple[T, int]] | None = None) -> None:
+        self._next = count().__next__
+        if items is not None:
+            self._heap = [(priority, self._next(), item) for item, priority in items]
+            heapq.heapify(self._heap)
+        else:
+            self._heap: list[tuple[int, int, T]] = []
 
     def put(self, item: T, priority: int = 0) -> None:
-        self._seq += 1
-        heapq.heappush(self._heap, (priority, self._seq, item))
+        heapq.heappush(self._heap, (priority, self._next(), item))
 
     def get(self) -> T:
         if not self._heap:
             raise IndexError("get from empty PriorityQueue")
         return heapq.heappop(self._heap)[2]
 
+    def put_get(self, item: T, priority: int = 0) -> T:
+        """Put ``item`` then get the front item with a single sift."""
+        return heapq.heappushpop(self._heap, (priority, self._next(), item))[2]
+
     def __len__(self) -> int:
         return len(self._heap)
 
@@ -6,8 +6,8 @@ all with readable string representations that show their current contents.
 
 from __future__ import annotations
 
+import array
 from collections import deque
-from dataclasses import dataclass
 from typing import Deque as TypingDeque
 from typing import Generic, Iterable, Iterator, TypeVar
 
@@ -18,7 +18,12 @@ class DynamicArray(Generic[T]):
     """A resizable contiguous array abstraction."""
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
-        self._data: list[T] = list(values) if values is not None else []
+        if values is None:
+            self._data: list[T] = []
+        elif type(values) is list:
+            self._data = values.copy()  # C memcpy, faster than list(iterable)
+        else:
+            self._data = list(values)
 
     def append(self, value: T) -> None:
         self._data.append(value)
@@ -57,7 +62,12 @@ class Stack(Generic[T]):
     """LIFO stack."""
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
-        self._items: list[T] = list(values) if values is not None else []
+        if values is None:
+            self._items: list[T] = []
+        elif type(values) is list:
+            self._items = values.copy()
+        else:
+            self._items = list(values)
 
     def push(self, value: T) -> None:
         self._items.append(value)
@@ -86,7 +96,7 @@ class Queue(Generic[T]):
     """FIFO queue."""
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
-        self._items: TypingDeque[T] = deque(values or [])
+        self._items: TypingDeque[T] = deque(values or ())
 
     def enqueue(self, value: T) -> None:
         self._items.append(value)
@@ -115,7 +125,7 @@ class Deque(Generic[T]):
     """Double-ended queue."""
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
-        self._items: TypingDeque[T] = deque(values or [])
+        self._items: TypingDeque[T] = deque(values or ())
 
     def append_left(self, value: T) -> None:
         self._items.appendleft(value)
@@ -141,13 +151,25 @@ class Deque(Generic[T]):
 
 
 class CircularQueue(Generic[T]):
-    """Fixed-capacity circular queue."""
+    """Fixed-capacity circular queue.
+
+    Pass an :mod:`array` ``typecode`` (e.g. ``'q'`` for signed 64-bit ints,
+    ``'d'`` for floats) to back the queue with a flat C buffer instead of a
+    Python list — far smaller and faster for numeric elements.
 
-    def __init__(self, capacity: int) -> None:
+    Dequeued slots are not cleared: the next enqueue that wraps around
+    overwrites them, so with the default list backing a dequeued object may
+    stay referenced (and alive for GC purposes) until its slot is reused.
+    """
+
+    def __init__(self, capacity: int, typecode: str | None = None) -> None:
         if capacity <= 0:
             raise ValueError("capacity must be > 0")
         self._capacity = capacity
-        self._data: list[T | None] = [None] * capacity
+        if typecode is None:
+            self._data: list[T | None] | array.array = [None] * capacity
+        else:
+            self._data = array.array(typecode, bytes(capacity * array.array(typecode).itemsize))
         self._front = 0
         self._size = 0
 
@@ -162,7 +184,6 @@ class CircularQueue(Generic[T]):
         if self._size == 0:
             raise IndexError("dequeue from empty CircularQueue")
         value = self._data[self._front]
-        self._data[self._front] = None
         self._front = (self._front + 1) % self._capacity
         self._size -= 1
         return value  # type: ignore[return-value]
@@ -175,10 +196,35 @@ class CircularQueue(Generic[T]):
         return f"CircularQueue(capacity={self._capacity}, front->rear={items!r})"
 
 
-@dataclass
 class _SNode(Generic[T]):
-    value: T
-    next: _SNode[T] | None = None
+    __slots__ = ("value", "next")
+
+    def __init__(self, value: T, next: _SNode[T] | None = None) -> None:
+        self.value = value
+        self.next = next
+
+
+# Bounded freelists so steady-state append/pop churn reuses node objects
+# instead of allocating (and GC-tracking) a fresh one per operation.
+_SNODE_FREELIST: TypingDeque[_SNode] = deque(maxlen=4096)
+
+
+def _get_snode(value: T, next: _SNode[T] | None) -> _SNode[T]:
+    try:
+        # pop-then-fallback rather than check-then-pop: the freelist is
+        # shared module state, so another thread may drain it in between.
+        node = _SNODE_FREELIST.pop()
+    except IndexError:
+        return _SNode(value, next)
+    node.value = value
+    node.next = next
+    return node
+
+
+def _release_snode(node: _SNode[T]) -> None:
+    node.value = None
+    node.next = None
+    _SNODE_FREELIST.append(node)
 
 
 class SinglyLinkedList(Generic[T]):
@@ -193,14 +239,14 @@ class SinglyLinkedList(Generic[T]):
                 self.append(value)
 
     def prepend(self, value: T) -> None:
-        node = _SNode(value=value, next=self._head)
+        node = _get_snode(value, self._head)
         self._head = node
         if self._tail is None:
             self._tail = node
         self._size += 1
 
     def append(self, value: T) -> None:
-        node = _SNode(value=value)
+        node = _get_snode(value, None)
         if self._tail is None:
             self._head = self._tail = node
         else:
@@ -212,11 +258,13 @@ class SinglyLinkedList(Generic[T]):
         if self._head is None:
             raise IndexError("pop_front from empty SinglyLinkedList")
         node = self._head
+        value = node.value
         self._head = node.next
         if self._head is None:
             self._tail = None
         self._size -= 1
-        return node.value
+        _release_snode(node)
+        return value
 
     def __iter__(self) -> Iterator[T]:
         cur = self._head
@@ -231,15 +279,67 @@ class SinglyLinkedList(Generic[T]):
         return f"SinglyLinkedList({list(self)!r})"
 
 
-@dataclass
 class _DNode(Generic[T]):
-    value: T
-    prev: _DNode[T] | None = None
-    next: _DNode[T] | None = None
+    __slots__ = ("value", "prev", "next")
+
+    def __init__(
+        self,
+        value: T,
+        prev: _DNode[T] | None = None,
+        next: _DNode[T] | None = None,
+    ) -> None:
+        self.value = value
+        self.prev = prev
+        self.next = next
+
+
+_DNODE_FREELIST: TypingDeque[_DNode] = deque(maxlen=4096)
+
+
+def _get_dnode(value: T) -> _DNode[T]:
+    try:
+        node = _DNODE_FREELIST.pop()
+    except IndexError:
+        return _DNode(value)
+    node.value = value
+    return node
+
+
+def _release_dnode(node: _DNode[T]) -> None:
+    node.value = None
+    node.prev = None
+    node.next = None
+    _DNODE_FREELIST.append(node)
 
 
 class DoublyLinkedList(Generic[T]):
-    """Doubly linked list with front/back operations."""
+    """Doubly linked list with front/back operations.
+
+    The public API only touches the ends, so by default instances are backed
+    by :class:`collections.deque` (a C doubly linked list of blocks), which
+    is far faster and smaller than per-element Python nodes. Use
+    :meth:`node_based` to get the explicit node-chain implementation, e.g.
+    for teaching or stepping through links.
+    """
+
+    _use_deque = True
+
+    def __new__(cls, values: Iterable[T] | None = None) -> DoublyLinkedList[T]:
+        if cls is DoublyLinkedList and cls._use_deque:
+            return super().__new__(_DequeBackedDLL)
+        return super().__new__(cls)
+
+    @classmethod
+    def node_based(cls, values: Iterable[T] | None = None) -> DoublyLinkedList[T]:
+        """Build the node-chain implementation regardless of ``_use_deque``."""
+        obj = super().__new__(cls)
+        obj.__init__(values)
+        return obj
+
+    @classmethod
+    def fast(cls, values: Iterable[T] | None = None) -> DoublyLinkedList[T]:
+        """Build the deque-backed implementation explicitly."""
+        return _DequeBackedDLL(values)
 
     def __init__(self, values: Iterable[T] | None = None) -> None:
         self._head: _DNode[T] | None = None
@@ -250,7 +350,7 @@ class DoublyLinkedList(Generic[T]):
                 self.append(v)
 
     def append(self, value: T) -> None:
-        node = _DNode(value)
+        node = _get_dnode(value)
         if self._tail is None:
             self._head = self._tail = node
         else:
@@ -260,7 +360,7 @@ class DoublyLinkedList(Generic[T]):
         self._size += 1
 
     def prepend(self, value: T) -> None:
-        node = _DNode(value)
+        node = _get_dnode(value)
         if self._head is None:
             self._head = self._tail = node
         else:
@@ -273,25 +373,29 @@ class DoublyLinkedList(Generic[T]):
         if self._head is None:
             raise IndexError("pop_front from empty DoublyLinkedList")
         node = self._head
+        value = node.value
         self._head = node.next
         if self._head is None:
             self._tail = None
         else:
             self._head.prev = None
         self._size -= 1
-        return node.value
+        _release_dnode(node)
+        return value
 
     def pop_back(self) -> T:
         if self._tail is None:
             raise IndexError("pop_back from empty DoublyLinkedList")
         node = self._tail
+        value = node.value
         self._tail = node.prev
         if self._tail is None:
             self._head = None
         else:
             self._tail.next = None
         self._size -= 1
-        return node.value
+        _release_dnode(node)
+        return value
 
     def __iter__(self) -> Iterator[T]:
         cur = self._head
@@ -304,3 +408,32 @@ class DoublyLinkedList(Generic[T]):
 
     def __repr__(self) -> str:
         return f"DoublyLinkedList({list(self)!r})"
+
+
+class _DequeBackedDLL(DoublyLinkedList[T]):
+    """Deque-backed implementation returned by ``DoublyLinkedList()``."""
+
+    def __init__(self, values: Iterable[T] | None = None) -> None:
+        self._items: TypingDeque[T] = deque(values or ())
+
+    def append(self, value: T) -> None:
+        self._items.append(value)
+
+    def prepend(self, value: T) -> None:
+        self._items.appendleft(value)
+
+    def pop_front(self) -> T:
+        if not self._items:
+            raise IndexError("pop_front from empty DoublyLinkedList")
+        return self._items.popleft()
+
+    def pop_back(self) -> T:
+        if not self._items:
+            raise IndexError("pop_back from empty DoublyLinkedList")
+        return self._items.pop()
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
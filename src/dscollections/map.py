@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import Generic, Iterator, TypeVar
 
+#: Largest collection that __repr__ will fully sort; bigger ones show only
+#: the smallest elements so printing a huge set stays cheap.
+_REPR_LIMIT = 20
+
 K = TypeVar("K")
 V = TypeVar("V")
 T = TypeVar("T")
@@ -56,4 +61,7 @@ class HashSet(Generic[T]):
         return iter(self._data)
 
     def __repr__(self) -> str:
-        return f"HashSet({sorted(self._data)!r})"
+        if len(self._data) <= _REPR_LIMIT:
+            return f"HashSet({sorted(self._data)!r})"
+        head = heapq.nsmallest(_REPR_LIMIT, self._data)  # O(n log k), not O(n log n)
+        return f"HashSet({head!r} + {len(self._data) - _REPR_LIMIT} more)"
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Generator, Generic, TypeVar
 
 T = TypeVar("T")
 
 
-@dataclass
 class _BSTNode(Generic[T]):
-    value: T
-    left: _BSTNode[T] | None = None
-    right: _BSTNode[T] | None = None
+    __slots__ = ("value", "left", "right")
+
+    def __init__(
+        self,
+        value: T,
+        left: _BSTNode[T] | None = None,
+        right: _BSTNode[T] | None = None,
+    ) -> None:
+        self.value = value
+        self.left = left
+        self.right = right
 
 
 class BinarySearchTree(Generic[T]):
@@ -56,34 +62,42 @@ class BinarySearchTree(Generic[T]):
         return False
 
     def in_order(self) -> Generator[T, None, None]:
-        def walk(node: _BSTNode[T] | None) -> Generator[T, None, None]:
-            if node is None:
-                return
-            yield from walk(node.left)
-            yield node.value
-            yield from walk(node.right)
-
-        yield from walk(self._root)
+        stack: list[_BSTNode[T]] = []
+        cur = self._root
+        while stack or cur is not None:
+            while cur is not None:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            yield cur.value
+            cur = cur.right
 
     def pre_order(self) -> Generator[T, None, None]:
-        def walk(node: _BSTNode[T] | None) -> Generator[T, None, None]:
-            if node is None:
-                return
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
             yield node.value
-            yield from walk(node.left)
-            yield from walk(node.right)
-
-        yield from walk(self._root)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
     def post_order(self) -> Generator[T, None, None]:
-        def walk(node: _BSTNode[T] | None) -> Generator[T, None, None]:
-            if node is None:
-                return
-            yield from walk(node.left)
-            yield from walk(node.right)
-            yield node.value
-
-        yield from walk(self._root)
+        if self._root is None:
+            return
+        # Two-stack method: reversed root-right-left order is post-order.
+        stack = [self._root]
+        out: list[T] = []
+        while stack:
+            node = stack.pop()
+            out.append(node.value)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        yield from reversed(out)
 
     def __contains__(self, value: T) -> bool:
         return self.contains(value)
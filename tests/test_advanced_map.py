@@ -1,4 +1,6 @@
-from dscollections import DisjointSet, HashMap, HashSet, Trie
+import pytest
+
+from dscollections import AsciiTrie, DisjointSet, DisjointSetInt, HashMap, HashSet, Trie
 
 
 def test_hash_map_and_set() -> None:
@@ -30,3 +32,96 @@ def test_disjoint_set() -> None:
     dsu.union(2, 3)
     assert dsu.connected(1, 3)
     assert "groups" in repr(dsu)
+
+
+def test_disjoint_set_long_chain_and_groups() -> None:
+    dsu = DisjointSet[int]()
+    for i in range(999):
+        dsu.union(i, i + 1)
+    assert dsu.connected(0, 999)
+    assert dsu.find(0) == dsu.find(500) == dsu.find(999)
+    dsu.make_set(5000)
+    assert not dsu.connected(0, 5000)
+
+
+def test_disjoint_set_int() -> None:
+    dsu = DisjointSetInt(6)
+    dsu.union(0, 1)
+    dsu.union(1, 2)
+    assert dsu.connected(0, 2)
+    assert not dsu.connected(0, 3)
+    assert dsu.find(2) == dsu.find(0)
+    assert len(dsu) == 6
+    assert "DisjointSetInt" in repr(dsu)
+
+
+def test_disjoint_set_int_bounds() -> None:
+    dsu = DisjointSetInt(3)
+    with pytest.raises(IndexError):
+        dsu.find(3)
+    with pytest.raises(IndexError):
+        dsu.find(-1)
+    with pytest.raises(IndexError):
+        dsu.union(0, 3)
+    with pytest.raises(IndexError):
+        dsu.union_many([0], [5])
+
+
+def test_disjoint_set_int_union_many() -> None:
+    dsu = DisjointSetInt(8)
+    dsu.union_many([0, 1, 4], [1, 2, 5])
+    assert dsu.connected(0, 2)
+    assert dsu.connected(4, 5)
+    assert not dsu.connected(0, 4)
+    with pytest.raises(ValueError):
+        dsu.union_many([0], [1, 2])
+
+
+def test_trie_from_words() -> None:
+    trie = Trie.from_words(["car", "card", "dog"])
+    assert trie.search("card")
+    assert not trie.search("ca")
+    assert trie.starts_with("do")
+    with pytest.raises(ValueError):
+        Trie.from_words(["a"], backend="pygtrie")
+
+
+def test_trie_insert_many() -> None:
+    words = ["care", "car", "cart", "dog", "do", "car"]
+    bulk = Trie()
+    bulk.insert_many(words)
+    one_by_one = Trie()
+    for word in words:
+        one_by_one.insert(word)
+    assert len(bulk) == len(one_by_one) == len(set(words))
+    for word in words:
+        assert bulk.search(word)
+    assert not bulk.search("c")
+    bulk.insert_many(["carpet"])
+    assert bulk.search("carpet") and bulk.search("cart")
+
+
+def test_ascii_trie() -> None:
+    trie = Trie.ascii()
+    assert isinstance(trie, AsciiTrie)
+    for word in ["cat", "car", "cat"]:
+        trie.insert(word)
+    assert len(trie) == 2
+    assert trie.search("car")
+    assert not trie.search("ca")
+    assert trie.starts_with("ca")
+    assert not trie.search("café")
+    with pytest.raises(UnicodeEncodeError):
+        trie.insert("café")
+    assert "AsciiTrie" in repr(trie)
+
+
+def test_hash_set_repr_is_bounded() -> None:
+    s = HashSet[int]()
+    for i in range(50):
+        s.add(i)
+    assert "more" in repr(s)
+    small = HashSet[int]()
+    small.add(2)
+    small.add(1)
+    assert repr(small) == "HashSet([1, 2])"
@@ -1,3 +1,5 @@
+import copy
+
 from dscollections import (
     CircularQueue,
     Deque,
@@ -49,6 +51,36 @@ def test_circular_queue() -> None:
     assert "CircularQueue" in repr(cq)
 
 
+def test_queue_and_deque_deepcopy_are_independent() -> None:
+    queue = Queue[int]([1])
+    queue_copy = copy.deepcopy(queue)
+    queue_copy.enqueue(42)
+    assert len(queue) == 1
+    assert len(queue_copy) == 2
+
+    d = Deque[int]([1])
+    d_copy = copy.deepcopy(d)
+    d_copy.append_right(2)
+    assert len(d) == 1
+    assert d_copy.pop_right() == 2
+
+
+def test_circular_queue_typecode_and_wraparound() -> None:
+    cq = CircularQueue(3, typecode="q")
+    for value in [10, 20, 30]:
+        cq.enqueue(value)
+    assert cq.dequeue() == 10
+    cq.enqueue(40)
+    assert [cq.dequeue() for _ in range(3)] == [20, 30, 40]
+
+    objects = CircularQueue[str](2)
+    objects.enqueue("a")
+    objects.enqueue("b")
+    assert objects.dequeue() == "a"
+    objects.enqueue("c")
+    assert [objects.dequeue(), objects.dequeue()] == ["b", "c"]
+
+
 def test_singly_linked_list() -> None:
     linked = SinglyLinkedList([2, 3])
     linked.prepend(1)
@@ -65,3 +97,30 @@ def test_doubly_linked_list() -> None:
     assert linked.pop_back() == 4
     assert list(linked) == [2, 3]
     assert "DoublyLinkedList" in repr(linked)
+
+
+def test_linked_list_node_freelist_reuse() -> None:
+    from dscollections.linear import _SNODE_FREELIST
+
+    linked = SinglyLinkedList([1])
+    released = len(_SNODE_FREELIST)
+    assert linked.pop_front() == 1
+    assert len(_SNODE_FREELIST) == released + 1
+    linked.append(9)
+    assert len(_SNODE_FREELIST) == released
+    assert linked.pop_front() == 9
+
+
+def test_doubly_linked_list_backends() -> None:
+    fast = DoublyLinkedList([1, 2])
+    assert isinstance(fast, DoublyLinkedList)
+    assert not hasattr(fast, "_head")  # deque-backed by default, no node chain
+    node_based = DoublyLinkedList.node_based([1, 2])
+    assert node_based._head is not None
+    for linked in (fast, node_based, DoublyLinkedList.fast([1, 2])):
+        linked.prepend(0)
+        linked.append(3)
+        assert list(linked) == [0, 1, 2, 3]
+        assert linked.pop_front() == 0
+        assert linked.pop_back() == 3
+        assert len(linked) == 2
@@ -1,3 +1,5 @@
+import pytest
+
 from dscollections import BinarySearchTree, Graph, MaxHeap, MinHeap, PriorityQueue
 
 
@@ -10,6 +12,15 @@ def test_bst_insertion_and_traversal() -> None:
     assert "in_order" in repr(bst)
 
 
+def test_bst_traversals_on_skewed_tree() -> None:
+    bst = BinarySearchTree[int]()
+    for value in range(2000):  # right-skewed, deeper than the recursion limit
+        bst.insert(value)
+    assert list(bst.in_order()) == list(range(2000))
+    assert list(bst.pre_order()) == list(range(2000))
+    assert list(bst.post_order()) == list(range(1999, -1, -1))
+
+
 def test_graph_bfs_and_dfs() -> None:
     graph = Graph[str](directed=False)
     graph.add_edge("A", "B")
@@ -33,3 +44,45 @@ def test_heaps_and_priority_queue() -> None:
     pq.put("low", priority=5)
     pq.put("high", priority=1)
     assert pq.get() == "high"
+
+
+def test_graph_dfs_sorted_is_deterministic() -> None:
+    graph = Graph[int](directed=False)
+    for a, b in [(1, 3), (1, 2), (2, 4), (3, 4)]:
+        graph.add_edge(a, b)
+    assert list(graph.dfs_sorted(1)) == [1, 2, 4, 3]
+    assert set(graph.dfs(1)) == {1, 2, 3, 4}
+
+
+def test_graph_repr_is_bounded() -> None:
+    graph = Graph[object]()
+    for i in range(30):
+        graph.add_edge("hub", i)
+    assert "more" in repr(graph)
+    small = Graph[int]()
+    small.add_edge(1, 2)
+    assert "more" not in repr(small)
+
+
+def test_heap_push_pop_and_replace() -> None:
+    min_heap = MinHeap([3, 1, 4])
+    assert min_heap.push_pop(0) == 0
+    assert min_heap.replace(10) == 1
+    assert sorted(min_heap.pop() for _ in range(3)) == [3, 4, 10]
+    with pytest.raises(IndexError):
+        MinHeap[int]().replace(1)
+
+    max_heap = MaxHeap([3, 1, 4])
+    assert max_heap.push_pop(9) == 9
+    assert max_heap.replace(0) == 4
+    assert max_heap.pop() == 3
+    with pytest.raises(IndexError):
+        MaxHeap[int]().replace(1)
+
+
+def test_priority_queue_seeding_and_put_get() -> None:
+    pq = PriorityQueue([("b", 2), ("a", 1), ("c", 2)])
+    assert len(pq) == 3
+    assert pq.put_get("z", priority=0) == "z"
+    assert pq.put_get("d", priority=3) == "a"
+    assert [pq.get() for _ in range(3)] == ["b", "c", "d"]